@@ -1,66 +1,110 @@
-from openai import AsyncOpenAI
+import httpx
+from openai import DEFAULT_CONNECTION_LIMITS, AsyncOpenAI, DefaultAsyncHttpxClient
 from agents.models.openai_chatcompletions import OpenAIChatCompletionsModel
 import os
+from dataclasses import dataclass
+from functools import lru_cache
 from dotenv import load_dotenv
-import sys
 
-load_dotenv()
+# one pool shared by every agent; the sdk's own sizes, with idle connections kept
+# long enough to survive the pause while the user types the next question
+HTTP_LIMITS = httpx.Limits(
+    max_connections=DEFAULT_CONNECTION_LIMITS.max_connections,
+    max_keepalive_connections=DEFAULT_CONNECTION_LIMITS.max_keepalive_connections,
+    keepalive_expiry=30.0,
+)
 
-def validate_api_config():
-    """validate api configuration and provide helpful error messages"""
-    api_key = os.getenv("OPENAI_API_KEY")
-    api_endpoint = os.getenv("OPENAI_API_ENDPOINT")
-    
-    if not api_key:
+@dataclass(frozen=True)
+class _ApiConfig:
+    api_key: str
+    api_endpoint: str
+
+@lru_cache(maxsize=1)
+def _load_env_once():
+    """read the .env file on first use instead of on every import path"""
+    load_dotenv()
+
+@lru_cache(maxsize=1)
+def _parse_config(raw_api_key, raw_api_endpoint):
+    """clean and validate raw env values once per distinct (key, endpoint) pair"""
+    if not raw_api_key:
         print("error: OPENAI_API_KEY environment variable is not set")
         print("please add OPENAI_API_KEY=your_api_key_here to your .env file")
-        return False
-    
-    if not api_endpoint:
+        return None
+
+    if not raw_api_endpoint:
         print("error: OPENAI_API_ENDPOINT environment variable is not set")
         print("please add OPENAI_API_ENDPOINT=your_endpoint_here to your .env file")
-        return False
-    
-    api_key = api_key.strip().rstrip('%').rstrip('"').rstrip("'")
-    
+        return None
+
+    api_key = raw_api_key.strip().rstrip('%').rstrip('"').rstrip("'")
+    api_endpoint = raw_api_endpoint.strip().rstrip('"').rstrip("'")
+
     if not api_key.startswith(('sk-', 'prx_live_', 'prx_test_')):
         print("warning: api key format doesn't match expected patterns")
         print("expected formats: sk-... (openai), prx_live_... (proxy), prx_test_... (proxy)")
-    
+
     if not api_endpoint.startswith(('http://', 'https://')):
         print("error: api endpoint must start with http:// or https://")
-        return False
-    
-    return True
+        return None
+
+    return _ApiConfig(api_key=api_key, api_endpoint=api_endpoint)
+
+def _get_config():
+    """get the cleaned api config, keyed on the current env so edits are still picked up"""
+    _load_env_once()
+    return _parse_config(os.getenv("OPENAI_API_KEY"), os.getenv("OPENAI_API_ENDPOINT"))
+
+def validate_api_config():
+    """validate api configuration and provide helpful error messages"""
+    return _get_config() is not None
+
+@lru_cache(maxsize=1)
+def _build_client(config):
+    """build one openai client per config so every agent shares its connection pool"""
+    return AsyncOpenAI(
+        api_key=config.api_key,
+        base_url=config.api_endpoint,
+        # keeps the sdk's default timeouts and redirect handling
+        http_client=DefaultAsyncHttpxClient(limits=HTTP_LIMITS),
+    )
 
 def get_client():
-    """get openai client with validation"""
-    if not validate_api_config():
-        print("\nplease fix the configuration issues above and try again")
-        sys.exit(1)
-    
-    api_key = os.getenv("OPENAI_API_KEY").strip().rstrip('%').rstrip('"').rstrip("'")
-    api_endpoint = os.getenv("OPENAI_API_ENDPOINT").strip().rstrip('"').rstrip("'")
-    
+    """get the shared openai client with validation"""
+    config = _get_config()
+    if config is None:
+        raise RuntimeError("invalid api configuration, please fix the issues above and try again")
+
     try:
-        client = AsyncOpenAI(
-            api_key=api_key,
-            base_url=api_endpoint
-        )
-        return client
+        return _build_client(config)
     except Exception as e:
-        print(f"error creating openai client: {e}")
-        sys.exit(1)
+        raise RuntimeError(f"error creating openai client: {e}") from e
+
+async def prewarm_client():
+    """open a keep-alive connection up front so the first agent turn skips the handshake"""
+    try:
+        await get_client().models.list()
+    except Exception:
+        # some proxies don't serve /models; the connection is pooled either way
+        pass
+
+async def aclose():
+    """release the shared client's connection pool"""
+    config = _get_config()
+    if config is None or _build_client.cache_info().currsize == 0:
+        return
+    client = _build_client(config)
+    _build_client.cache_clear()
+    await client.close()
 
 def get_model():
     """get openai model with validation"""
+    client = get_client()
     try:
         model = OpenAIChatCompletionsModel(
             model="gpt-4o-mini",
-            openai_client=get_client()
+            openai_client=client
         )
         return model
     except Exception as e:
-        print(f"error creating model: {e}")
-        print("please check your api configuration and try again")
-        sys.exit(1)
\ No newline at end of file
+        raise RuntimeError(f"error creating model: {e}") from e
\ No newline at end of file
@@ -1,3 +1,5 @@
+import itertools
+from functools import lru_cache
 from agents import Agent, SQLiteSession
 from agentic_app_quickstart.examples.helpers import get_model
 from tools import (
@@ -12,98 +14,132 @@ from tools import (
     suggest_questions,
 )
 
+# keys of the dict returned by setup_agent_handoffs
+COORDINATOR = "coordinator"
+DATA_LOADER = "data_loader"
+ANALYTICS = "analytics"
+COMMUNICATION = "communication"
 
+
+DATA_LOADER_INSTRUCTIONS = """you are the data loader agent. you handle csv file operations.
+
+you can load csv files, show column information, and provide dataset overview.
+if someone asks for analysis or guidance, redirect them to the appropriate agent."""
+
+ANALYTICS_INSTRUCTIONS = """you are the analytics agent. you handle data analysis and calculations.
+
+you can calculate averages, correlations, detect outliers, and perform statistical analysis.
+if someone needs to load files or get guidance, redirect them to the appropriate agent."""
+
+COMMUNICATION_INSTRUCTIONS = """you are the communication agent. you provide guidance and suggestions.
+
+you can suggest questions, provide guidance, and explain data concepts.
+if someone needs to load files or perform analysis, redirect them to the appropriate agent."""
+
+COORDINATOR_INSTRUCTIONS = """you are the coordinator agent. you coordinate between specialized agents.
+
+redirect users to appropriate agents:
+- file operations -> "ask the data loader agent"
+- data analysis -> "ask the analytics agent"
+- guidance and help -> "ask the communication agent"
+
+you can only explain system capabilities and direct users to agents.
+never handle specialized tasks yourself."""
+
+# tool bundles are built once at import and shared by the agent factories
+_COLUMN_TOOLS = (get_column_names, get_column_info)
+_DATA_TOOLS = (load_csv_file, *_COLUMN_TOOLS)
+_ANALYTICS_TOOLS = (
+    calculate_column_average,
+    count_rows_with_value,
+    find_correlations,
+    detect_outliers,
+    group_by_column,
+    *_COLUMN_TOOLS,
+)
+_COMMS_TOOLS = (suggest_questions, *_COLUMN_TOOLS)
+_COORD_TOOLS = _COLUMN_TOOLS
+
+# process-wide source of distinct session ids
+_session_ids = itertools.count(1)
+
+
+@lru_cache(maxsize=1)
 def create_data_loader_agent():
     return Agent(
         name="DataLoaderAgent",
-        instructions="""you are the data loader agent. you handle csv file operations.
-
-        you can load csv files, show column information, and provide dataset overview.
-        if someone asks for analysis or guidance, redirect them to the appropriate agent.""",
+        instructions=DATA_LOADER_INSTRUCTIONS,
         model=get_model(),
-        tools=[load_csv_file, get_column_names, get_column_info],
+        tools=list(_DATA_TOOLS),
         handoffs=[],
     )
 
 
+@lru_cache(maxsize=1)
 def create_analytics_agent():
     """create the analytics agent responsible for data analysis and calculations"""
     return Agent(
         name="AnalyticsAgent",
-        instructions="""you are the analytics agent. you handle data analysis and calculations.
-
-        you can calculate averages, correlations, detect outliers, and perform statistical analysis.
-        if someone needs to load files or get guidance, redirect them to the appropriate agent.""",
+        instructions=ANALYTICS_INSTRUCTIONS,
         model=get_model(),
-        tools=[
-            calculate_column_average,
-            count_rows_with_value,
-            find_correlations,
-            detect_outliers,
-            group_by_column,
-            get_column_names,
-            get_column_info,
-        ],
+        tools=list(_ANALYTICS_TOOLS),
         handoffs=[],
     )
 
 
+@lru_cache(maxsize=1)
 def create_communication_agent():
     """create the communication agent responsible for user interaction and response formatting"""
     return Agent(
         name="CommunicationAgent",
-        instructions="""you are the communication agent. you provide guidance and suggestions.
-
-        you can suggest questions, provide guidance, and explain data concepts.
-        if someone needs to load files or perform analysis, redirect them to the appropriate agent.""",
+        instructions=COMMUNICATION_INSTRUCTIONS,
         model=get_model(),
-        tools=[suggest_questions, get_column_names, get_column_info],
+        tools=list(_COMMS_TOOLS),
         handoffs=[],
     )
 
 
+@lru_cache(maxsize=1)
 def create_coordinator_agent():
     """create the main coordinator agent that manages handoffs between specialized agents"""
     return Agent(
         name="CoordinatorAgent",
-        instructions="""you are the coordinator agent. you coordinate between specialized agents.
-
-        redirect users to appropriate agents:
-        - file operations -> "ask the data loader agent"
-        - data analysis -> "ask the analytics agent"
-        - guidance and help -> "ask the communication agent"
-
-        you can only explain system capabilities and direct users to agents.
-        never handle specialized tasks yourself.""",
+        instructions=COORDINATOR_INSTRUCTIONS,
         model=get_model(),
-        tools=[get_column_names, get_column_info],
+        tools=list(_COORD_TOOLS),
         handoffs=[],
     )
 
 
-def setup_agent_handoffs():
-    """setup handoff relationships between all agents"""
+@lru_cache(maxsize=1)
+def _build_agent_bundle():
+    """build and wire the agents once; handoffs are set on the shared instances"""
     data_agent = create_data_loader_agent()
     analytics_agent = create_analytics_agent()
     communication_agent = create_communication_agent()
     coordinator_agent = create_coordinator_agent()
 
-    data_agent.handoffs = [analytics_agent, communication_agent, coordinator_agent]
-    analytics_agent.handoffs = [data_agent, communication_agent, coordinator_agent]
-    communication_agent.handoffs = [data_agent, analytics_agent, coordinator_agent]
-    coordinator_agent.handoffs = [data_agent, analytics_agent, communication_agent]
+    # every agent can hand off to every other agent, never to itself
+    all_agents = (data_agent, analytics_agent, communication_agent, coordinator_agent)
+    for agent in all_agents:
+        agent.handoffs = [other for other in all_agents if other is not agent]
 
     return {
-        "coordinator": coordinator_agent,
-        "data_loader": data_agent,
-        "analytics": analytics_agent,
-        "communication": communication_agent,
+        COORDINATOR: coordinator_agent,
+        DATA_LOADER: data_agent,
+        ANALYTICS: analytics_agent,
+        COMMUNICATION: communication_agent,
     }
 
 
+def setup_agent_handoffs():
+    """setup handoff relationships between all agents"""
+    return dict(_build_agent_bundle())
+
+
 def create_session(session_id: int = None):
     """create a session for maintaining conversation memory"""
     if session_id is None:
-        session_id = hash(str(id)) % 10000
+        session_id = next(_session_ids)
 
     return SQLiteSession(session_id=session_id)
@@ -1,180 +1,437 @@
 import asyncio
+import itertools
 import os
+import re
+import sys
+import threading
+from functools import lru_cache
+from pathlib import Path
 from agents import Runner, set_tracing_disabled
-from agent_definitions import setup_agent_handoffs, create_session
+from openai.types.responses import ResponseTextDeltaEvent
+from agentic_app_quickstart.examples.helpers import aclose, prewarm_client
+from agent_definitions import (
+    ANALYTICS,
+    COMMUNICATION,
+    COORDINATOR,
+    DATA_LOADER,
+    create_session,
+    setup_agent_handoffs,
+)
+from tools import data_manager
+
+try:
+    import uvloop
+
+    # faster drop-in event loop when installed, the standard asyncio loop otherwise
+    _run_event_loop = uvloop.run
+except ImportError:
+    _run_event_loop = asyncio.run
 
 set_tracing_disabled(True)
 
+# longer pastes are cut down before they reach the model
+MAX_INPUT_CHARS = 8192
+
+# shown while waiting for the first token on an interactive terminal
+SPINNER_FRAMES = "|/-\\"
+
+# checked in order; the first agent whose keywords appear in the question handles it
+INPUT_ROUTES = (
+    (
+        ANALYTICS,
+        re.compile(
+            r"\b(average|mean|median|sum|total|count|highest|lowest|max|maximum|min|minimum"
+            r"|correlat\w*|outliers?|group\w*|statistic\w*|analy[sz]\w*|calculat\w*)\b",
+            re.IGNORECASE,
+        ),
+    ),
+    # asking to load is always the data loader's job
+    (DATA_LOADER, re.compile(r"\b(load\w*)\b", re.IGNORECASE)),
+    (
+        COMMUNICATION,
+        re.compile(r"\b(suggest\w*|questions?|guidance|explain\w*|help)\b", re.IGNORECASE),
+    ),
+    # nouns like "file" or "dataset" turn up in most questions, so they only decide when
+    # nothing more specific did
+    (DATA_LOADER, re.compile(r"\b(files?|csv|datasets?|columns?)\b", re.IGNORECASE)),
+)
+
+# reply keywords that point at each agent; when a reply names several agents,
+# the one listed first here wins, wherever its keyword appears
+HANDOFF_KEYWORDS = {
+    DATA_LOADER: ("data loader", "file"),
+    ANALYTICS: ("analytics", "analysis", "calculation"),
+    COMMUNICATION: ("communication", "guidance", "help"),
+    COORDINATOR: ("coordinator", "general"),
+}
+
+
+def build_handoff_re(agent_keys):
+    """one case-insensitive pattern with a named group per agent, so lastgroup names the match"""
+    groups = [
+        f"(?P<{key}>{'|'.join(map(re.escape, HANDOFF_KEYWORDS[key]))})"
+        for key in HANDOFF_KEYWORDS
+        if key in agent_keys
+    ]
+    return re.compile("|".join(groups), re.IGNORECASE)
+
+
+HELP_BANNER = """
+(^_^) Available Commands:
+  • help                    - show this help message
+  • agents                  - list available ai agents
+  • load <filename>         - load a csv dataset
+  • quit/exit               - end the session
+
+(o_o) Example Questions:
+  • 'what columns are in the dataset?'
+  • 'what is the average price?'
+  • 'are there any outliers in the salary column?'
+  • 'suggest some questions i can ask'
+
+"""
+
+AGENT_DESCRIPTIONS = {
+    COORDINATOR: (
+        "main system coordinator",
+        "handles general requests and coordinates other agents",
+    ),
+    DATA_LOADER: (
+        "specializes in file operations and data loading",
+        "validates csv files and prepares data for analysis",
+    ),
+    ANALYTICS: (
+        "performs statistical analysis and calculations",
+        "detects patterns, correlations, and outliers",
+    ),
+    COMMUNICATION: (
+        "provides user guidance and explanations",
+        "suggests analysis approaches and follow-up questions",
+    ),
+}
+
+
+class _StdinLines:
+    """read stdin lines from the event loop rather than from a thread blocked in input()"""
+
+    # a thread left in input() at exit holds the stdin buffer lock, and interpreter
+    # shutdown aborts on it when stdin is a pipe
+
+    def __init__(self, fd: int, encoding: str):
+        self._fd = fd
+        self._encoding = encoding
+        self._buffer = b""
+        self._eof = False
+
+    async def _wait_readable(self):
+        loop = asyncio.get_running_loop()
+        ready = loop.create_future()
+        try:
+            loop.add_reader(self._fd, ready.set_result, None)
+        except (NotImplementedError, PermissionError):
+            # regular files never block; loops without add_reader read in place
+            return
+        try:
+            await ready
+        finally:
+            loop.remove_reader(self._fd)
+
+    async def readline(self) -> str:
+        while b"\n" not in self._buffer and not self._eof:
+            await self._wait_readable()
+            # readable, so this returns what's there instead of blocking
+            chunk = os.read(self._fd, 65536)
+            if chunk:
+                self._buffer += chunk
+            else:
+                self._eof = True
+
+        if not self._buffer:
+            raise EOFError
+        line, _, self._buffer = self._buffer.partition(b"\n")
+        return line.decode(self._encoding, errors="replace")
+
+
+@lru_cache(maxsize=1)
+def _stdin_lines():
+    # one reader for the process, so lines it has buffered aren't lost between prompts
+    return _StdinLines(sys.stdin.fileno(), sys.stdin.encoding or "utf-8")
+
+
+async def read_input(prompt: str) -> str:
+    """read a line without blocking the event loop while the user types"""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    return await _stdin_lines().readline()
+
 
 class CSVAnalysisSystem:
     def __init__(self):
-        self.agents = setup_agent_handoffs()
-        self.current_agent = self.agents["coordinator"]
+        # agents and banners are filled in by _ainit
+        self.agents = {}
+        self.current_agent = None
+        # one conversation shared by every agent, so a handoff keeps the context
         self.session = create_session()
-        self.data_dir = os.path.join(os.path.dirname(__file__), "data")
+        self._handoff_re = None
+        self.data_dir = Path(__file__).parent / "data"
+        self._prewarm_task = None
+        self._preload_task = None
+        self._preload_stop = threading.Event()
+        # (data_dir mtime, csv filenames), refreshed only when the directory changes
+        self._csv_cache = (0, ())
+        self._welcome_banner = ""
+        self._agents_banner = ""
+        self._commands = {
+            "help": self.print_help,
+            "agents": self.print_agents,
+            "quit": self._quit_command,
+            "exit": self._quit_command,
+            "bye": self._quit_command,
+        }
+
+    async def _ainit(self):
+        """build the agents and scan the data directory in parallel"""
+        self.agents, _ = await asyncio.gather(
+            asyncio.to_thread(setup_agent_handoffs), asyncio.to_thread(self._list_csvs)
+        )
+        self.current_agent = self.agents[COORDINATOR]
+        # only agents that actually exist can be matched
+        self._handoff_re = build_handoff_re(self.agents)
+        # banners are fixed for the session, so build each one once
+        self._welcome_banner = self._build_welcome_banner()
+        self._agents_banner = self._build_agents_banner()
+
+    def _list_csvs(self):
+        mtime = os.stat(self.data_dir).st_mtime_ns
+        if mtime == self._csv_cache[0]:
+            return self._csv_cache[1]
+
+        with os.scandir(self.data_dir) as entries:
+            files = tuple(sorted(e.name for e in entries if e.name.endswith(".csv")))
+        self._csv_cache = (mtime, files)
+        return files
+
+    def _preload_datasets(self):
+        data_manager.preload(
+            (str(self.data_dir / f) for f in self._list_csvs()), stop=self._preload_stop
+        )
+
+    def _build_welcome_banner(self):
+        return "\n".join(
+            [
+                "=" * 60,
+                "  [*_*] CSV Data Analysis Agent System",
+                "  (^_^) Multi-Agent Architecture with Memory",
+                "=" * 60,
+                "",
+                "(o_o) Type 'help' for commands, 'agents' for agent info, or 'quit' to exit",
+                f"(>_<) Sample datasets: {', '.join(self._list_csvs())}",
+                "",
+                "",
+            ]
+        )
+
+    def _build_agents_banner(self):
+        lines = ["", "(^_^) Available Agents:", "─" * 40]
+        for name, agent in self.agents.items():
+            lines.append(f"  {name}: {agent.name}")
+            lines.extend(f"    • {line}" for line in AGENT_DESCRIPTIONS.get(name, ()))
+        lines += ["", ""]
+        return "\n".join(lines)
 
     def print_welcome(self):
-        print("=" * 60)
-        print("  [*_*] CSV Data Analysis Agent System")
-        print("  (^_^) Multi-Agent Architecture with Memory")
-        print("=" * 60)
-        print()
-        print("(o_o) Type 'help' for commands, 'agents' for agent info, or 'quit' to exit")
-        print("(>_<) Sample datasets: employee_data.csv, sample_sales.csv, weather_data.csv")
-        print()
+        sys.stdout.write(self._welcome_banner)
 
     def print_help(self):
-        print()
-        print("(^_^) Available Commands:")
-        print("  • help                    - show this help message")
-        print("  • agents                  - list available ai agents")
-        print("  • load <filename>         - load a csv dataset")
-        print("  • quit/exit               - end the session")
-        print()
-        print("(o_o) Example Questions:")
-        print("  • 'what columns are in the dataset?'")
-        print("  • 'what is the average price?'")
-        print("  • 'are there any outliers in the salary column?'")
-        print("  • 'suggest some questions i can ask'")
-        print()
+        sys.stdout.write(HELP_BANNER)
 
     def print_agents(self):
-        print()
-        print("(^_^) Available Agents:")
-        print("─" * 40)
-        for name, agent in self.agents.items():
-            print(f"  {name}: {agent.name}")
-            if name == "coordinator":
-                print("    • main system coordinator")
-                print("    • handles general requests and coordinates other agents")
-            elif name == "data_loader":
-                print("    • specializes in file operations and data loading")
-                print("    • validates csv files and prepares data for analysis")
-            elif name == "analytics":
-                print("    • performs statistical analysis and calculations")
-                print("    • detects patterns, correlations, and outliers")
-            elif name == "communication":
-                print("    • provides user guidance and explanations")
-                print("    • suggests analysis approaches and follow-up questions")
-        print()
+        sys.stdout.write(self._agents_banner)
 
     def detect_handoff_intent(self, response: str) -> str:
-        response_lower = response.lower()
-
-        if "data loader" in response_lower or "file" in response_lower:
-            return "data_loader"
-        elif (
-            "analytics" in response_lower
-            or "analysis" in response_lower
-            or "calculation" in response_lower
-        ):
-            return "analytics"
-        elif (
-            "communication" in response_lower
-            or "guidance" in response_lower
-            or "help" in response_lower
-        ):
-            return "communication"
-        elif "coordinator" in response_lower or "general" in response_lower:
-            return "coordinator"
-
-        return None
+        found = {match.lastgroup for match in self._handoff_re.finditer(response)}
+        return next((key for key in HANDOFF_KEYWORDS if key in found), None)
 
     def print_message_separator(self):
         print("┈" * 60)
 
-    async def process_user_input(self, user_input: str):
+    async def _stream_run(self, agent, user_input: str) -> str:
+        """print the reply as the model generates it and return the full text"""
+        result = Runner.run_streamed(starting_agent=agent, input=user_input, session=self.session)
+        # a plain task rather than a TaskGroup, which would wrap run errors in an ExceptionGroup
+        spinner = asyncio.create_task(self._spinner()) if sys.stdout.isatty() else None
+        started = False
         try:
-            # first check if current agent wants to hand off
-            check_result = await Runner.run(
-                starting_agent=self.current_agent, input=user_input, session=self.session
-            )
+            async for event in result.stream_events():
+                if event.type != "raw_response_event":
+                    continue
+                if isinstance(event.data, ResponseTextDeltaEvent):
+                    if not started:
+                        await self._stop_spinner(spinner)
+                        # the header waits for the first token so errors don't land mid-line
+                        sys.stdout.write(f"(^_^) {agent.name}: ")
+                        started = True
+                    sys.stdout.write(event.data.delta)
+                    sys.stdout.flush()
+        finally:
+            await self._stop_spinner(spinner)
 
-            check_response = check_result.final_output
-            handoff_target = self.detect_handoff_intent(check_response)
+        if started:
+            sys.stdout.write("\n")
+        else:
+            sys.stdout.write(f"(^_^) {agent.name}: {result.final_output}\n")
+        return result.final_output
 
-            if handoff_target and handoff_target in self.agents:
-                target_agent = self.agents[handoff_target]
+    async def _spinner(self, label: str = "thinking"):
+        """animate a status line until cancelled, then wipe it"""
+        text = ""
+        try:
+            for frame in itertools.cycle(SPINNER_FRAMES):
+                text = f"(o_o) {label} {frame}"
+                sys.stdout.write(f"\r{text}")
+                sys.stdout.flush()
+                await asyncio.sleep(0.1)
+        finally:
+            sys.stdout.write(f"\r{' ' * len(text)}\r")
+            sys.stdout.flush()
 
-                if target_agent.name != self.current_agent.name:
-                    self.current_agent = target_agent
-                    print(f"(o_o) handing over to {self.current_agent.name}")
+    async def _stop_spinner(self, spinner):
+        if spinner is not None and not spinner.done():
+            spinner.cancel()
+            # let the spinner clear its line before anything else is written
+            await asyncio.wait({spinner})
 
-                    result = await Runner.run(
-                        starting_agent=self.current_agent, input=user_input, session=self.session
-                    )
+    def route_input(self, user_input: str):
+        """pick an agent from the question itself, before any model call"""
+        for agent_key, pattern in INPUT_ROUTES:
+            if pattern.search(user_input):
+                return agent_key
+        return None
 
-                    response = result.final_output
-                    print(f"(^_^) {self.current_agent.name}: {response}")
-                else:
-                    # no actual handoff, show original response
-                    print(f"(^_^) {self.current_agent.name}: {check_response}")
-            else:
-                # no handoff needed, show original response
-                print(f"(^_^) {self.current_agent.name}: {check_response}")
+    def _hand_over(self, agent_key: str):
+        target_agent = self.agents[agent_key]
+        # agents are built once, so identity is enough to spot a real switch
+        if target_agent is not self.current_agent:
+            self.current_agent = target_agent
+            print(f"(o_o) handing over to {self.current_agent.name}")
+
+    async def process_user_input(self, user_input: str, agent_key: str = None):
+        # route on the input so each turn costs exactly one model call
+        route_target = agent_key or self.route_input(user_input)
+        if route_target is not None:
+            self._hand_over(route_target)
+
+        # the reply is printed while it streams in
+        response = await self._stream_run(self.current_agent, user_input)
 
-        except Exception as e:
-            print(f"(>_<) error occurred: {str(e)}")
-            print("(o_o) please try again or type 'help' for assistance")
+        if route_target is None:
+            # ambiguous input: let the reply pick the agent for the next turn
+            handoff_target = self.detect_handoff_intent(response)
+            if handoff_target in self.agents:
+                self._hand_over(handoff_target)
+
+    def _quit_command(self):
+        sys.stdout.write("\n(T_T) thank you for using the csv data analysis system. goodbye!\n")
+        return True
+
+    async def _load_command(self, filename: str):
+        if not filename.endswith(".csv"):
+            filename += ".csv"
+
+        filepath = self.data_dir / filename
+        try:
+            filepath.stat()
+        except OSError:
+            listing = "".join(f"  • {file}\n" for file in self._list_csvs())
+            sys.stdout.write(
+                f"(>_<) file not found: {filename}\n(o_o) available files:\n{listing}\n"
+            )
+            return
+
+        # only the data loader has the load tool, whatever words the path contains
+        await self.process_user_input(f"please load the csv file: {filepath}", DATA_LOADER)
+
+    async def shutdown(self):
+        """stop the startup prewarm and preload if they're still running"""
+        if self._prewarm_task is not None and not self._prewarm_task.done():
+            self._prewarm_task.cancel()
+            await asyncio.gather(self._prewarm_task, return_exceptions=True)
+        if self._preload_task is not None:
+            # the worker thread can't be cancelled; it stops after the file it's parsing
+            self._preload_stop.set()
+            await asyncio.gather(self._preload_task, return_exceptions=True)
 
     async def run(self):
         """main one"""
+        # warm the api connection while the user reads the banner
+        self._prewarm_task = asyncio.create_task(prewarm_client())
+        # parse the sample datasets in the background so the first load is a cache hit
+        self._preload_task = asyncio.create_task(asyncio.to_thread(self._preload_datasets))
         self.print_welcome()
 
         while True:
             try:
-                user_input = input("(^_^) you: ").strip()
+                user_input = (await read_input("(^_^) you: ")).strip()
 
                 if not user_input:
                     continue
 
-                if user_input.lower() in ["quit", "exit", "bye"]:
-                    print()
-                    print("(T_T) thank you for using the csv data analysis system. goodbye!")
-                    break
+                if len(user_input) > MAX_INPUT_CHARS:
+                    print(f"(>_<) input too long, keeping the first {MAX_INPUT_CHARS} characters")
+                    user_input = user_input[:MAX_INPUT_CHARS]
 
-                if user_input.lower() == "help":
-                    self.print_help()
+                lowered = user_input.lower()
+                command = self._commands.get(lowered)
+                if command is not None:
+                    # commands return True when the session should end
+                    if command():
+                        break
                     continue
 
-                if user_input.lower() == "agents":
-                    self.print_agents()
-                    continue
-
-                if user_input.lower().startswith("load "):
-                    filename = user_input[5:].strip()
-                    if not filename.endswith(".csv"):
-                        filename += ".csv"
-
-                    filepath = os.path.join(self.data_dir, filename)
-                    if os.path.exists(filepath):
-                        await self.process_user_input(f"please load the csv file: {filepath}")
-                    else:
-                        print(f"(>_<) file not found: {filename}")
-                        print("(o_o) available files:")
-                        sample_files = [f for f in os.listdir(self.data_dir) if f.endswith(".csv")]
-                        for file in sample_files:
-                            print(f"  • {file}")
-                        print()
+                if lowered.startswith("load "):
+                    await self._load_command(user_input[5:].strip())
                     continue
 
                 await self.process_user_input(user_input)
                 self.print_message_separator()
 
-            except KeyboardInterrupt:
-                print(
-                    "\n\n(>_<) session interrupted. type 'quit' to exit or continue with your questions."
-                )
-                continue
+            except asyncio.CancelledError:
+                # ctrl+c now arrives as a cancellation of the running task
+                print("\n\n(T_T) session interrupted. goodbye!")
+                break
             except EOFError:
                 print("\n\n(T_T) end of input. goodbye!")
                 break
+            except Exception as e:
+                # one guard for every turn, including load commands
+                sys.stdout.write(
+                    f"(>_<) error occurred: {e}\n"
+                    "(o_o) please try again or type 'help' for assistance\n"
+                )
 
 
 async def main():
-    system = CSVAnalysisSystem()
-    await system.run()
+    # python 3.12+: tasks run synchronously until their first real await
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        asyncio.get_running_loop().set_task_factory(eager_task_factory)
+
+    try:
+        system = CSVAnalysisSystem()
+        await system._ainit()
+    except RuntimeError as e:
+        print(f"(>_<) {e}")
+        sys.exit(1)
+
+    try:
+        await system.run()
+    finally:
+        await system.shutdown()
+        await aclose()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        _run_event_loop(main())
+    except KeyboardInterrupt:
+        pass
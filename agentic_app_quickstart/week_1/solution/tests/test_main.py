@@ -0,0 +1,127 @@
+import os
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import main
+from agent_definitions import ANALYTICS, COMMUNICATION, COORDINATOR, DATA_LOADER
+
+
+class _StubRun:
+    """stands in for Runner.run_streamed: no text deltas, just a final output"""
+
+    def __init__(self, final_output):
+        self.final_output = final_output
+
+    async def stream_events(self):
+        return
+        yield
+
+
+class TestCSVAnalysisSystem(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.system = main.CSVAnalysisSystem()
+        self.system.agents = {
+            key: SimpleNamespace(name=key)
+            for key in (COORDINATOR, DATA_LOADER, ANALYTICS, COMMUNICATION)
+        }
+        self.system.current_agent = self.system.agents[COORDINATOR]
+        self.system._handoff_re = main.build_handoff_re(self.system.agents)
+
+        self.calls = []
+        self.sessions = []
+        patcher = mock.patch.object(main.Runner, "run_streamed", side_effect=self._run)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        stdout = mock.patch.object(main.sys, "stdout")
+        stdout.start()
+        self.addCleanup(stdout.stop)
+
+    def _run(self, starting_agent, input, session):
+        self.calls.append((starting_agent.name, input))
+        self.sessions.append(session)
+        return _StubRun(f"reply {len(self.calls)}")
+
+    async def test_repeated_input_runs_the_agent_every_time(self):
+        """test that a repeated turn reaches the agent, since tools like load have side effects"""
+        for _ in range(2):
+            await self.system.process_user_input("please load the csv file: weather_data.csv")
+            await self.system.process_user_input("and the median?")
+
+        self.assertEqual(len(self.calls), 4)
+
+    async def test_handoff_keeps_the_conversation(self):
+        """test that every agent runs on the one shared session, so context survives handoffs"""
+        await self.system.process_user_input("load the employee csv")
+        await self.system.process_user_input("what is the average salary?")
+        await self.system.process_user_input("suggest some questions")
+
+        self.assertEqual(
+            [agent for agent, _ in self.calls], [DATA_LOADER, ANALYTICS, COMMUNICATION]
+        )
+        self.assertTrue(all(session is self.system.session for session in self.sessions))
+
+    def test_route_input(self):
+        cases = {
+            "what is the maximum salary?": ANALYTICS,
+            "show the min and max temperature": ANALYTICS,
+            "are there outliers in price?": ANALYTICS,
+            "which columns does the file have?": DATA_LOADER,
+            "suggest some questions": COMMUNICATION,
+            "mind explaining the trend?": COMMUNICATION,
+            "suggest some questions i can ask about this dataset": COMMUNICATION,
+            "what questions can I ask about the file?": COMMUNICATION,
+            "can you explain the columns?": COMMUNICATION,
+            "help me understand this csv": COMMUNICATION,
+            "help me load the sales csv": DATA_LOADER,
+            "is this a minor issue?": None,
+            "how many minutes did it take?": None,
+        }
+        for user_input, expected in cases.items():
+            with self.subTest(user_input=user_input):
+                self.assertEqual(self.system.route_input(user_input), expected)
+
+    async def test_load_command_goes_to_the_data_loader(self):
+        """test that words in the file name or path never pick the agent"""
+        self.system.data_dir = main.Path("/srv/analysis")
+        with mock.patch.object(main.Path, "stat"):
+            await self.system._load_command("max_temps")
+
+        self.assertEqual(
+            self.calls, [(DATA_LOADER, "please load the csv file: /srv/analysis/max_temps.csv")]
+        )
+        self.assertIs(self.system.current_agent, self.system.agents[DATA_LOADER])
+
+    def test_handoff_intent_follows_agent_priority(self):
+        """test that the highest-priority agent named in a reply wins, not the earliest"""
+        cases = {
+            "For help with that, ask the analytics agent.": ANALYTICS,
+            "the analysis needs a file first": DATA_LOADER,
+            "the coordinator can offer guidance": COMMUNICATION,
+            "nothing to hand over": None,
+        }
+        for response, expected in cases.items():
+            with self.subTest(response=response):
+                self.assertEqual(self.system.detect_handoff_intent(response), expected)
+
+
+class TestStdinLines(unittest.IsolatedAsyncioTestCase):
+    async def test_reads_lines_until_end_of_input(self):
+        read_fd, write_fd = os.pipe()
+        self.addCleanup(os.close, read_fd)
+        lines = main._StdinLines(read_fd, "utf-8")
+
+        os.write(write_fd, "load employee_data\nwhat is the average".encode())
+        self.assertEqual(await lines.readline(), "load employee_data")
+
+        # a line completed by a later write is joined up
+        os.write(write_fd, " salary?\nbye".encode())
+        os.close(write_fd)
+        self.assertEqual(await lines.readline(), "what is the average salary?")
+        self.assertEqual(await lines.readline(), "bye")
+        with self.assertRaises(EOFError):
+            await lines.readline()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,192 @@
+import unittest
+import os
+import tempfile
+import threading
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+
+from tools import CSVDataManager
+
+
+class TestCSVDataManager(unittest.TestCase):
+    def setUp(self):
+        self.employee_file = os.path.join("data", "employee_data.csv")
+        self.manager = CSVDataManager()
+        self.manager.load_csv_file(self.employee_file)
+        self.df = pd.read_csv(self.employee_file)
+
+    def test_column_info_matches_pandas(self):
+        """test that precomputed column stats match direct pandas reductions"""
+        info = self.manager.get_column_info("salary")
+        salary = self.df["salary"]
+
+        self.assertAlmostEqual(info["min_value"], salary.min())
+        self.assertAlmostEqual(info["max_value"], salary.max())
+        self.assertAlmostEqual(info["mean_value"], salary.mean())
+        self.assertAlmostEqual(info["median_value"], salary.median())
+        self.assertAlmostEqual(info["std_deviation"], salary.std())
+
+    def test_column_average(self):
+        result = self.manager.calculate_column_average("performance_score")
+        self.assertAlmostEqual(result["average"], self.df["performance_score"].mean())
+
+        result = self.manager.calculate_column_average("department")
+        self.assertIn("error", result)
+
+    def test_boolean_columns_are_numeric(self):
+        """test that true/false columns keep the stats pandas gives them"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "flags.csv")
+            with open(path, "w") as f:
+                f.write("score,active\n1.5,True\n2.5,False\n4.0,True\n")
+            self.manager.load_csv_file(path)
+            active = pd.read_csv(path)["active"]
+
+            info = self.manager.get_column_info("active")
+            self.assertAlmostEqual(info["mean_value"], active.mean())
+            self.assertAlmostEqual(info["std_deviation"], active.std())
+            self.assertAlmostEqual(
+                self.manager.calculate_column_average("active")["average"], active.mean()
+            )
+            self.assertEqual(self.manager.detect_outliers("active", 1.0)["outlier_count"], 1)
+            # correlations still cover the numeric columns only
+            self.assertIn("error", self.manager.find_correlations())
+
+    def test_correlations_on_a_single_row(self):
+        """test that a one-row file gives no correlations and no numpy warnings"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "one_row.csv")
+            with open(path, "w") as f:
+                f.write("a,b\n1,2\n")
+            self.manager.load_csv_file(path)
+
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                self.assertEqual(self.manager.find_correlations()["correlations"], [])
+
+    def test_count_rows_with_value(self):
+        department = self.df["department"].iloc[0]
+        result = self.manager.count_rows_with_value("department", department)
+        self.assertEqual(result["matching_rows"], (self.df["department"] == department).sum())
+
+        # values arrive as text, numeric columns still match
+        salary = self.df["salary"].iloc[0]
+        result = self.manager.count_rows_with_value("salary", str(salary))
+        self.assertEqual(result["matching_rows"], (self.df["salary"] == salary).sum())
+
+    def test_categorical_group_by_matches_pandas(self):
+        grouped = self.df.groupby("department")["salary"]
+        for agg_function in ["sum", "mean", "count"]:
+            result = self.manager.group_by_column("department", "salary", agg_function)["results"]
+            expected = getattr(grouped, agg_function)().to_dict()
+            self.assertEqual(list(result), list(expected))
+            for department, value in expected.items():
+                self.assertAlmostEqual(result[department], value)
+
+    def test_boolean_group_by_matches_pandas(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "flags.csv")
+            with open(path, "w") as f:
+                f.write("team,active\n" + "red,True\nblue,False\nred,False\nblue,True\n" * 2)
+            self.manager.load_csv_file(path)
+            df = pd.read_csv(path)
+
+            for agg_function in ["sum", "mean", "max"]:
+                result = self.manager.group_by_column("team", "active", agg_function)
+                expected = getattr(df.groupby("team")["active"], agg_function)().to_dict()
+                self.assertEqual(result["results"], expected)
+                self.assertEqual(
+                    [type(v) for v in result["results"].values()],
+                    [type(v) for v in expected.values()],
+                )
+
+            # text never equals a bool cell, as with the plain == comparison
+            self.assertEqual(self.manager.count_rows_with_value("active", "1")["matching_rows"], 0)
+
+    def test_repeated_analysis_is_cached(self):
+        first = self.manager.group_by_column("department", "salary", "mean")
+        self.assertIs(first, self.manager.group_by_column("department", "salary", "mean"))
+        self.assertIsNot(first, self.manager.group_by_column("department", "salary", "max"))
+
+    def test_reload_reuses_parsed_dataset(self):
+        """test that loading an unchanged file again skips re-parsing"""
+        first = self.manager.load_csv_file(self.employee_file)["dataset_info"]["dataframe"]
+        second = self.manager.load_csv_file(self.employee_file)["dataset_info"]["dataframe"]
+        self.assertIs(first, second)
+
+    def test_reload_picks_up_rewritten_file(self):
+        """test that a changed file is parsed again instead of served from cache"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "small.csv")
+            with open(path, "w") as f:
+                f.write("a,b\n1,2\n")
+            self.assertEqual(self.manager.load_csv_file(path)["dataset_info"]["rows"], 1)
+
+            with open(path, "w") as f:
+                f.write("a,b\n1,2\n3,4\n")
+            self.assertEqual(self.manager.load_csv_file(path)["dataset_info"]["rows"], 2)
+
+    def test_column_selections_leave_the_cached_frame_alone(self):
+        """test that copy-on-write keeps edits to a selection out of the shared cached frame"""
+        df = self.manager.loaded_datasets[self.manager.current_dataset]["dataframe"]
+        salary = df["salary"].iloc[0]
+
+        selection = df["salary"]
+        selection.iloc[0] = -1
+        subset = df[["salary", "performance_score"]]
+        subset.iloc[0, 0] = -2
+
+        self.assertEqual(df["salary"].iloc[0], salary)
+
+    def test_cache_budget_evicts_least_recent_but_not_current(self):
+        manager = CSVDataManager(max_cache_bytes=1)
+        weather_file = os.path.join("data", "weather_data.csv")
+        manager.load_csv_file(self.employee_file)
+        manager.load_csv_file(weather_file)
+
+        # over budget: only the dataset in use survives
+        self.assertEqual(list(manager.loaded_datasets), [os.path.abspath(weather_file)])
+        self.assertIn("error", manager.calculate_column_average("salary"))
+        self.assertIn("average", manager.calculate_column_average("temperature"))
+
+    def test_concurrent_loads_keep_cache_accounting(self):
+        """test that loads and a preload from several threads leave the byte count consistent"""
+        files = [
+            os.path.join("data", name)
+            for name in ["employee_data.csv", "weather_data.csv", "sample_sales.csv"]
+        ]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            pool.submit(self.manager.preload, files)
+            for result in pool.map(self.manager.load_csv_file, files * 20):
+                self.assertTrue(result["success"])
+
+        cached = self.manager.loaded_datasets.values()
+        self.assertEqual(self.manager._cached_bytes, sum(info["nbytes"] for info in cached))
+        self.assertIn(self.manager.current_dataset, self.manager.loaded_datasets)
+
+    def test_preload_keeps_current_dataset(self):
+        weather_file = os.path.join("data", "weather_data.csv")
+        self.manager.preload([weather_file])
+
+        self.assertEqual(self.manager.current_dataset, os.path.abspath(self.employee_file))
+        self.assertIn(os.path.abspath(weather_file), self.manager.loaded_datasets)
+
+    def test_preload_stops_when_asked(self):
+        stop = threading.Event()
+        weather_file = os.path.join("data", "weather_data.csv")
+        sales_file = os.path.join("data", "sample_sales.csv")
+
+        def files():
+            yield weather_file
+            # as if shutdown began while the first file was parsing
+            stop.set()
+            yield sales_file
+
+        self.manager.preload(files(), stop=stop)
+        self.assertIn(os.path.abspath(weather_file), self.manager.loaded_datasets)
+        self.assertNotIn(os.path.abspath(sales_file), self.manager.loaded_datasets)
+
+
+if __name__ == "__main__":
+    unittest.main()
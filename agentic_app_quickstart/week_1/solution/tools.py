@@ -3,31 +3,348 @@ import numpy as np
 from typing import Dict, Any
 from agents import function_tool
 import os
+import re
+import threading
+import warnings
+from collections import OrderedDict
+from functools import wraps
+
+try:
+    import pyarrow  # noqa: F401
+
+    # multithreaded arrow parser when available, pandas' default C parser otherwise
+    _CSV_ENGINE = "pyarrow"
+except ImportError:
+    _CSV_ENGINE = None
+
+# repeated tool calls with the same arguments on the same file version reuse the result
+_TOOL_CACHE_SIZE = 128
+
+# parsed datasets kept in memory at once; the current dataset is always kept
+_DATASET_CACHE_BYTES = 512 * 1024 * 1024
+
+# shared by every tool; callers only read it
+_NO_DATASET_ERROR = {"error": "no dataset loaded"}
+
+# sample values are collected a slice at a time so a long column stops at the first few
+_SAMPLE_CHUNK_ROWS = 4096
+
+# column selections share memory with the cached frame instead of copying it;
+# always on from pandas 3, where the option is deprecated
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+_STRING_DTYPES = ["object", "string"]
+
+_AGG_FUNCTIONS = {
+    "mean": lambda grouped: grouped.mean(),
+    "sum": lambda grouped: grouped.sum(),
+    "count": lambda grouped: grouped.count(),
+    "min": lambda grouped: grouped.min(),
+    "max": lambda grouped: grouped.max(),
+    "median": lambda grouped: grouped.median(),
+}
+
+
+def _partition_columns(df: pd.DataFrame) -> Dict[str, list]:
+    """split column names by kind once so tools don't rescan dtypes on every call"""
+    return {
+        "numeric_columns": list(df.select_dtypes(include=[np.number]).columns),
+        # numeric for the column tools, but left out of correlations as before
+        "boolean_columns": list(df.select_dtypes(include=["bool", "boolean"]).columns),
+        "categorical_columns": list(
+            df.select_dtypes(include=[*_STRING_DTYPES, "category"]).columns
+        ),
+        "date_columns": list(df.select_dtypes(include=["datetime64"]).columns),
+    }
+
+
+def _summarize_numeric_columns(
+    values: np.ndarray, numeric_cols: list
+) -> Dict[str, Dict[str, float]]:
+    """compute describe()-style stats for every numeric column at once on the float64 array"""
+    if not numeric_cols:
+        return {}
+
+    # all-nan or single-value columns give nan stats, as describe() does, without the warnings
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        stats = {
+            "count": (~np.isnan(values)).sum(axis=0),
+            "mean": np.nanmean(values, axis=0),
+            "std": np.nanstd(values, axis=0, ddof=1),
+            "min": np.nanmin(values, axis=0),
+            **dict(zip(["25%", "50%", "75%"], np.nanpercentile(values, [25, 50, 75], axis=0))),
+            "max": np.nanmax(values, axis=0),
+        }
+
+    return {
+        col: {name: float(column_stats[i]) for name, column_stats in stats.items()}
+        for i, col in enumerate(numeric_cols)
+    }
+
+
+def _optimize_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """shrink integer columns, parse iso dates and store low-cardinality strings as categoricals"""
+    # lossless; floats stay float64 so reported stats keep full precision
+    for col in df.select_dtypes(include=["integer"]).columns:
+        df[col] = pd.to_numeric(df[col], downcast="integer")
+
+    for col in df.select_dtypes(include=_STRING_DTYPES).columns:
+        values = df[col].dropna()
+        if values.empty:
+            continue
+
+        if _ISO_DATE_RE.match(str(values.iloc[0])):
+            try:
+                df[col] = pd.to_datetime(df[col], format="ISO8601")
+                continue
+            except (ValueError, TypeError):
+                pass
+
+        if values.nunique() / len(df) < 0.5:
+            df[col] = df[col].astype("category")
+    return df
+
+
+def _memoize_tool(method):
+    """cache a read-only analysis method per (dataset version, method, arguments)"""
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        dataset = self._current()
+        if dataset is None:
+            return method(self, *args, **kwargs)
+
+        key = (
+            dataset["file_path"],
+            dataset["signature"],
+            method.__name__,
+            args,
+            tuple(sorted(kwargs.items())),
+        )
+        with self._lock:
+            result = self._tool_cache.get(key)
+            if result is not None:
+                self._tool_cache.move_to_end(key)
+                return result
+
+        # computed outside the lock so other tool calls aren't held up
+        result = method(self, *args, **kwargs)
+        with self._lock:
+            # a load that switched datasets meanwhile may have changed what the method saw
+            if self.loaded_datasets.get(self.current_dataset) is dataset:
+                self._tool_cache[key] = result
+                if len(self._tool_cache) > _TOOL_CACHE_SIZE:
+                    self._tool_cache.popitem(last=False)
+        return result
+
+    return wrapper
+
+
+def _categorical_aggregate(
+    keys: pd.Series, values: np.ndarray, agg_function: str, integer: bool
+) -> Dict[Any, Any]:
+    """sum, mean or count per category straight from the codes; None when pandas must do it"""
+    if agg_function not in ("sum", "mean", "count") or not isinstance(
+        keys.dtype, pd.CategoricalDtype
+    ):
+        return None
+
+    categories = keys.cat.categories
+    codes = keys.cat.codes.to_numpy()
+    grouped = codes >= 0
+    present = grouped & ~np.isnan(values)
+
+    # a category is reported when it has rows at all, like groupby(observed=True)
+    observed = np.bincount(codes[grouped], minlength=len(categories)) > 0
+    counts = np.bincount(codes[present], minlength=len(categories))
+    if agg_function == "count":
+        results = counts
+    else:
+        # bincount returns ints for empty input, so pin the dtype
+        sums = np.bincount(
+            codes[present], weights=values[present], minlength=len(categories)
+        ).astype(np.float64, copy=False)
+        if agg_function == "sum":
+            results = sums.round().astype(np.int64) if integer else sums
+        else:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                results = sums / counts
+
+    return {
+        category: value
+        for category, value, seen in zip(categories.tolist(), results.tolist(), observed)
+        if seen
+    }
+
+
+def _first_distinct(col_data: pd.Series, limit: int = 5) -> list:
+    """first `limit` distinct non-null values in order, without hashing the whole column"""
+    found = []
+    for start in range(0, len(col_data), _SAMPLE_CHUNK_ROWS):
+        stop = start + _SAMPLE_CHUNK_ROWS
+        chunk = col_data.iloc[start:stop].dropna().unique()
+        for value in chunk.tolist():
+            if value not in found:
+                found.append(value)
+                if len(found) == limit:
+                    return found
+    return found
+
+
+class _LazyColumnStats:
+    """per-column dtype, missing-value and distinct-value counts, computed on first request"""
+
+    def __init__(self, df: pd.DataFrame):
+        self._df = df
+        self._missing = {}
+        self._unique = {}
+
+    def dtype(self, column_name: str):
+        return self._df.dtypes[column_name]
+
+    def missing(self, column_name: str) -> int:
+        count = self._missing.get(column_name)
+        if count is None:
+            count = int(self._df[column_name].isnull().sum())
+            self._missing[column_name] = count
+        return count
+
+    def unique(self, column_name: str) -> int:
+        count = self._unique.get(column_name)
+        if count is None:
+            count = int(self._df[column_name].nunique())
+            self._unique[column_name] = count
+        return count
 
 
 class CSVDataManager:
-    def __init__(self):
-        self.loaded_datasets = {}
+    def __init__(self, max_cache_bytes: int = _DATASET_CACHE_BYTES):
+        # least recently used first; trimmed to max_cache_bytes, never evicting the current dataset
+        self.loaded_datasets = OrderedDict()
         self.current_dataset = None
+        self.max_cache_bytes = max_cache_bytes
+        self._cached_bytes = 0
+        # (file_path, group_column, signature) -> groupby object, reused across aggregations
+        self._grouper_cache = {}
+        # (file_path, column, signature) -> value_counts series, reused across searched values
+        self._value_counts_cache = {}
+        # lru of analysis results, see _memoize_tool
+        self._tool_cache = OrderedDict()
+        # sync tools run in worker threads, sometimes several at once, alongside the preload;
+        # held for cache bookkeeping only, never while parsing or computing
+        self._lock = threading.Lock()
+
+    def _read_dataset(self, file_path: str, stat: os.stat_result = None) -> Dict[str, Any]:
+        if stat is None:
+            stat = os.stat(file_path)
+        df = _optimize_dtypes(pd.read_csv(file_path, engine=_CSV_ENGINE))
+        partition = _partition_columns(df)
+        # numeric columns first, so correlations can take the leading block as a view
+        numeric_cols = partition["numeric_columns"] + partition["boolean_columns"]
+        # column-major float64 copy of the numeric columns, one contiguous array per column;
+        # booleans become 0.0/1.0
+        numeric_values = np.asfortranarray(
+            df[numeric_cols].to_numpy(dtype=np.float64, na_value=np.nan)
+        )
+        # measured once per parse so eviction never has to walk the frames again
+        nbytes = int(df.memory_usage(deep=True).sum()) + numeric_values.nbytes
+        return {
+            "file_path": file_path,
+            "nbytes": nbytes,
+            # (mtime, size) identifies the parsed version; size catches same-tick rewrites
+            "signature": (stat.st_mtime_ns, stat.st_size),
+            "rows": len(df),
+            "columns": list(df.columns),
+            # dtypes and null counts are only needed column by column, so defer the scan
+            "column_stats": _LazyColumnStats(df),
+            **partition,
+            # column -> position in numeric_values; doubles as the o(1) "is numeric" check
+            "numeric_positions": {col: i for i, col in enumerate(numeric_cols)},
+            "numeric_summary": _summarize_numeric_columns(numeric_values, numeric_cols),
+            "numeric_values": numeric_values,
+            "dataframe": df,
+        }
+
+    def _current(self):
+        """the current dataset's info, or None; a concurrent load can't evict it mid-lookup"""
+        with self._lock:
+            return self.loaded_datasets.get(self.current_dataset)
+
+    def _remember(self, key: str, dataset_info: Dict[str, Any]) -> None:
+        """cache a parsed dataset, evicting the least recently used ones over the byte budget;
+        the caller holds self._lock"""
+        previous = self.loaded_datasets.pop(key, None)
+        if previous is not None:
+            self._cached_bytes -= previous["nbytes"]
+        self.loaded_datasets[key] = dataset_info
+        self._cached_bytes += dataset_info["nbytes"]
+
+        for old_key in list(self.loaded_datasets):
+            if self._cached_bytes <= self.max_cache_bytes:
+                break
+            if old_key in (key, self.current_dataset):
+                continue
+            self._cached_bytes -= self.loaded_datasets.pop(old_key)["nbytes"]
+            self._drop_column_caches(old_key)
+
+    def _drop_column_caches(self, dataset_key: str) -> None:
+        """forget per-column helpers built from an older parse of this file; the caller holds
+        self._lock"""
+        self._grouper_cache = {
+            cache_key: grouper
+            for cache_key, grouper in self._grouper_cache.items()
+            if cache_key[0] != dataset_key
+        }
+        self._value_counts_cache = {
+            cache_key: counts
+            for cache_key, counts in self._value_counts_cache.items()
+            if cache_key[0] != dataset_key
+        }
+
+    def preload(self, file_paths, stop: threading.Event = None) -> None:
+        """parse csv files ahead of time without changing the current dataset"""
+        for file_path in file_paths:
+            # checked between files so shutdown waits for one parse at most
+            if stop is not None and stop.is_set():
+                break
+            key = os.path.abspath(file_path)
+            if key in self.loaded_datasets:
+                continue
+            try:
+                dataset_info = self._read_dataset(key)
+            except Exception:
+                # load_csv_file reports the error if this file is actually requested
+                continue
+            with self._lock:
+                # a load_csv_file that finished meanwhile has the fresher entry
+                if key not in self.loaded_datasets:
+                    self._remember(key, dataset_info)
 
     def load_csv_file(self, file_path: str) -> Dict[str, Any]:
         try:
-            if not os.path.exists(file_path):
+            key = os.path.abspath(file_path)
+            try:
+                stat = os.stat(key)
+            except FileNotFoundError:
                 return {"error": f"file not found: {file_path}"}
 
-            df = pd.read_csv(file_path)
-            dataset_info = {
-                "file_path": file_path,
-                "rows": len(df),
-                "columns": list(df.columns),
-                "data_types": df.dtypes.to_dict(),
-                "missing_values": df.isnull().sum().to_dict(),
-                "dataframe": df,
-            }
-
-            self.loaded_datasets[file_path] = dataset_info
-            self.current_dataset = file_path
-
+            signature = (stat.st_mtime_ns, stat.st_size)
+            with self._lock:
+                dataset_info = self.loaded_datasets.get(key)
+            parsed = dataset_info is None or dataset_info["signature"] != signature
+            if parsed:
+                dataset_info = self._read_dataset(key, stat)
+            with self._lock:
+                if parsed:
+                    self._drop_column_caches(key)
+                self.current_dataset = key
+                # (re)inserting marks it most recently used
+                self._remember(key, dataset_info)
+
+            df = dataset_info["dataframe"]
             return {
                 "success": True,
                 "message": f"loaded {len(df)} rows and {len(df.columns)} columns from {file_path}",
@@ -37,132 +354,184 @@ class CSVDataManager:
             return {"error": f"failed to load csv: {str(e)}"}
 
     def get_column_names(self) -> Dict[str, Any]:
-        if not self.current_dataset:
-            return {"error": "no dataset loaded"}
+        dataset = self._current()
+        if dataset is None:
+            return _NO_DATASET_ERROR
 
-        df = self.loaded_datasets[self.current_dataset]["dataframe"]
-        return {"columns": list(df.columns), "total_columns": len(df.columns)}
+        columns = dataset["columns"]
+        return {"columns": columns, "total_columns": len(columns)}
 
+    @_memoize_tool
     def get_column_info(self, column_name: str) -> Dict[str, Any]:
-        if not self.current_dataset:
-            return {"error": "no dataset loaded"}
+        dataset = self._current()
+        if dataset is None:
+            return _NO_DATASET_ERROR
 
-        df = self.loaded_datasets[self.current_dataset]["dataframe"]
+        df = dataset["dataframe"]
 
         if column_name not in df.columns:
             return {"error": f"column '{column_name}' not found"}
 
         col_data = df[column_name]
+        column_stats = dataset["column_stats"]
         info = {
             "column_name": column_name,
-            "data_type": str(col_data.dtype),
+            "data_type": str(column_stats.dtype(column_name)),
             "total_values": len(col_data),
-            "missing_values": col_data.isnull().sum(),
-            "unique_values": col_data.nunique(),
+            "missing_values": column_stats.missing(column_name),
+            "unique_values": column_stats.unique(column_name),
         }
 
-        if pd.api.types.is_numeric_dtype(col_data):
+        summary = dataset["numeric_summary"].get(column_name)
+        if summary is not None:
             info.update(
                 {
-                    "min_value": float(col_data.min()),
-                    "max_value": float(col_data.max()),
-                    "mean_value": float(col_data.mean()),
-                    "median_value": float(col_data.median()),
-                    "std_deviation": float(col_data.std()),
+                    "min_value": float(summary["min"]),
+                    "max_value": float(summary["max"]),
+                    "mean_value": float(summary["mean"]),
+                    "median_value": float(summary["50%"]),
+                    "std_deviation": float(summary["std"]),
                 }
             )
-        elif pd.api.types.is_datetime64_any_dtype(col_data):
+        elif column_name in dataset["date_columns"]:
             info.update({"date_range": {"start": str(col_data.min()), "end": str(col_data.max())}})
         else:
-            info["sample_values"] = col_data.dropna().unique()[:5].tolist()
+            info["sample_values"] = _first_distinct(col_data)
 
         return info
 
+    @_memoize_tool
     def calculate_column_average(self, column_name: str) -> Dict[str, Any]:
         """calculate the average value of a numeric column"""
-        if not self.current_dataset:
-            return {"error": "no dataset loaded"}
+        dataset = self._current()
+        if dataset is None:
+            return _NO_DATASET_ERROR
 
-        df = self.loaded_datasets[self.current_dataset]["dataframe"]
+        df = dataset["dataframe"]
 
         if column_name not in df.columns:
             return {"error": f"column '{column_name}' not found"}
 
-        col_data = df[column_name]
-        if not pd.api.types.is_numeric_dtype(col_data):
+        summary = dataset["numeric_summary"].get(column_name)
+        if summary is None:
             return {"error": f"column '{column_name}' is not numeric"}
 
-        avg_value = col_data.mean()
+        avg_value = summary["mean"]
         return {
             "column_name": column_name,
             "average": float(avg_value),
-            "total_values": len(col_data),
-            "missing_values": col_data.isnull().sum(),
+            "total_values": dataset["rows"],
+            "missing_values": dataset["column_stats"].missing(column_name),
         }
 
+    @_memoize_tool
     def count_rows_with_value(self, column_name: str, value: str) -> Dict[str, Any]:
         """count rows that contain a specific value in a column"""
-        if not self.current_dataset:
-            return {"error": "no dataset loaded"}
+        dataset = self._current()
+        if dataset is None:
+            return _NO_DATASET_ERROR
 
-        df = self.loaded_datasets[self.current_dataset]["dataframe"]
+        df = dataset["dataframe"]
 
         if column_name not in df.columns:
             return {"error": f"column '{column_name}' not found"}
 
-        count = (df[column_name] == value).sum()
+        # keyed on the parse too, so counts from a frame a concurrent reload replaced never match
+        counts_key = (dataset["file_path"], column_name, dataset["signature"])
+        with self._lock:
+            counts = self._value_counts_cache.get(counts_key)
+        if counts is None:
+            counts = df[column_name].value_counts(dropna=False)
+            with self._lock:
+                self._value_counts_cache[counts_key] = counts
+
+        # the tool passes every value as text; match it against the column's own type
+        lookup = value
+        try:
+            if column_name in dataset["boolean_columns"]:
+                # compared as text, "True" never equalled a bool cell
+                lookup = None
+            elif column_name in dataset["numeric_positions"]:
+                lookup = float(value)
+            elif column_name in dataset["date_columns"]:
+                lookup = pd.Timestamp(value)
+        except ValueError:
+            lookup = None
+
+        count = 0 if lookup is None else int(counts.get(lookup, 0))
         total_rows = len(df)
 
         return {
             "column_name": column_name,
             "search_value": value,
-            "matching_rows": int(count),
+            "matching_rows": count,
             "total_rows": total_rows,
-            "percentage": round((count / total_rows) * 100, 2),
+            "percentage": round(count * 100 / total_rows, 2) if total_rows else 0.0,
         }
 
+    @_memoize_tool
     def find_correlations(self) -> Dict[str, Any]:
         """find correlations between numeric columns"""
-        if not self.current_dataset:
-            return {"error": "no dataset loaded"}
+        dataset = self._current()
+        if dataset is None:
+            return _NO_DATASET_ERROR
 
-        df = self.loaded_datasets[self.current_dataset]["dataframe"]
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
+        numeric_cols = dataset["numeric_columns"]
 
         if len(numeric_cols) < 2:
             return {"error": "need at least 2 numeric columns for correlation analysis"}
 
-        corr_matrix = df[numeric_cols].corr()
-        correlations = []
-
-        for i in range(len(numeric_cols)):
-            for j in range(i + 1, len(numeric_cols)):
-                col1, col2 = numeric_cols[i], numeric_cols[j]
-                corr_value = corr_matrix.loc[col1, col2]
-                correlations.append(
-                    {"column1": col1, "column2": col2, "correlation": round(float(corr_value), 3)}
-                )
+        values = dataset["numeric_values"][:, : len(numeric_cols)]
+        if np.isnan(values).any():
+            # pandas drops missing values pair by pair, which corrcoef can't do
+            corr_matrix = dataset["dataframe"][numeric_cols].corr().to_numpy()
+        else:
+            # constant columns and files under two rows give nan, which is filtered out below,
+            # without the warnings
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore", RuntimeWarning)
+                corr_matrix = np.corrcoef(values, rowvar=False)
+
+        # gather, filter and round the upper triangle in numpy, leaving only dict building
+        rows, cols = np.triu_indices(len(numeric_cols), k=1)
+        pair_values = corr_matrix[rows, cols]
+        defined = ~np.isnan(pair_values)
+        correlations = [
+            {"column1": numeric_cols[i], "column2": numeric_cols[j], "correlation": v}
+            for i, j, v in zip(
+                rows[defined].tolist(),
+                cols[defined].tolist(),
+                np.round(pair_values[defined], 3).tolist(),
+            )
+        ]
 
-        return {"numeric_columns": list(numeric_cols), "correlations": correlations}
+        return {"numeric_columns": numeric_cols, "correlations": correlations}
 
+    @_memoize_tool
     def detect_outliers(self, column_name: str, threshold: float = 2.0) -> Dict[str, Any]:
         """detect statistical outliers in a numeric column using z-score method"""
-        if not self.current_dataset:
-            return {"error": "no dataset loaded"}
+        dataset = self._current()
+        if dataset is None:
+            return _NO_DATASET_ERROR
 
-        df = self.loaded_datasets[self.current_dataset]["dataframe"]
+        df = dataset["dataframe"]
 
         if column_name not in df.columns:
             return {"error": f"column '{column_name}' not found"}
 
-        col_data = df[column_name]
-        if not pd.api.types.is_numeric_dtype(col_data):
+        position = dataset["numeric_positions"].get(column_name)
+        if position is None:
             return {"error": f"column '{column_name}' is not numeric"}
 
-        z_scores = np.abs((col_data - col_data.mean()) / col_data.std())
-        outliers = z_scores > threshold
+        # mean and std come from the load-time summary, so only the mask touches the data;
+        # |x - mean| > threshold * std is the z-score test without the division
+        summary = dataset["numeric_summary"][column_name]
+        values = dataset["numeric_values"][:, position]
+        with np.errstate(invalid="ignore"):
+            outliers = np.abs(values - summary["mean"]) > threshold * summary["std"]
 
-        outlier_indices = outliers[outliers].index.tolist()
+        col_data = df[column_name]
+        outlier_indices = df.index[outliers].tolist()
         outlier_values = col_data[outliers].tolist()
 
         return {
@@ -174,28 +543,55 @@ class CSVDataManager:
             "total_values": len(col_data),
         }
 
+    @_memoize_tool
     def group_by_column(
         self, group_column: str, agg_column: str, agg_function: str = "mean"
     ) -> Dict[str, Any]:
         """group data by a column and apply aggregation to another column"""
-        if not self.current_dataset:
-            return {"error": "no dataset loaded"}
+        dataset = self._current()
+        if dataset is None:
+            return _NO_DATASET_ERROR
 
-        df = self.loaded_datasets[self.current_dataset]["dataframe"]
+        df = dataset["dataframe"]
 
         if group_column not in df.columns:
             return {"error": f"group column '{group_column}' not found"}
         if agg_column not in df.columns:
             return {"error": f"aggregation column '{agg_column}' not found"}
 
-        if not pd.api.types.is_numeric_dtype(df[agg_column]):
+        if agg_column not in dataset["numeric_positions"]:
             return {"error": f"aggregation column '{agg_column}' must be numeric"}
 
-        valid_functions = ["mean", "sum", "count", "min", "max", "median"]
-        if agg_function not in valid_functions:
-            return {"error": f"invalid aggregation function. use one of: {valid_functions}"}
+        aggregate = _AGG_FUNCTIONS.get(agg_function)
+        if aggregate is None:
+            return {"error": f"invalid aggregation function. use one of: {list(_AGG_FUNCTIONS)}"}
+
+        # categorical keys with sum/mean/count skip pandas' groupby machinery entirely;
+        # pandas sums booleans to integers, so they count as integer here
+        results = _categorical_aggregate(
+            df[group_column],
+            dataset["numeric_values"][:, dataset["numeric_positions"][agg_column]],
+            agg_function,
+            pd.api.types.is_integer_dtype(dataset["column_stats"].dtype(agg_column))
+            or agg_column in dataset["boolean_columns"],
+        )
+        if results is not None:
+            return {
+                "group_column": group_column,
+                "aggregation_column": agg_column,
+                "aggregation_function": agg_function,
+                "results": results,
+            }
+
+        grouper_key = (dataset["file_path"], group_column, dataset["signature"])
+        with self._lock:
+            grouper = self._grouper_cache.get(grouper_key)
+        if grouper is None:
+            grouper = df.groupby(group_column, observed=True)
+            with self._lock:
+                self._grouper_cache[grouper_key] = grouper
 
-        grouped = df.groupby(group_column)[agg_column].agg(agg_function)
+        grouped = aggregate(grouper[agg_column])
 
         return {
             "group_column": group_column,
@@ -204,17 +600,18 @@ class CSVDataManager:
             "results": grouped.to_dict(),
         }
 
+    @_memoize_tool
     def suggest_questions(self) -> Dict[str, Any]:
         """suggest relevant questions based on the loaded dataset"""
-        if not self.current_dataset:
-            return {"error": "no dataset loaded"}
+        dataset = self._current()
+        if dataset is None:
+            return _NO_DATASET_ERROR
 
-        df = self.loaded_datasets[self.current_dataset]["dataframe"]
         suggestions = []
 
-        numeric_cols = df.select_dtypes(include=[np.number]).columns
-        categorical_cols = df.select_dtypes(include=["object"]).columns
-        date_cols = df.select_dtypes(include=["datetime64"]).columns
+        numeric_cols = dataset["numeric_columns"]
+        categorical_cols = dataset["categorical_columns"]
+        date_cols = dataset["date_columns"]
 
         if len(numeric_cols) > 0:
             suggestions.extend(
@@ -274,19 +671,23 @@ def get_column_info(column_name: str) -> str:
         return f"error: {result['error']}"
 
     info = result
-    response = f"column '{column_name}' info:\n"
-    response += f"- data type: {info['data_type']}\n"
-    response += f"- total values: {info['total_values']}\n"
-    response += f"- missing values: {info['missing_values']}\n"
-    response += f"- unique values: {info['unique_values']}\n"
+    lines = [
+        f"column '{column_name}' info:\n",
+        f"- data type: {info['data_type']}\n",
+        f"- total values: {info['total_values']}\n",
+        f"- missing values: {info['missing_values']}\n",
+        f"- unique values: {info['unique_values']}\n",
+    ]
 
     if "mean_value" in info:
-        response += f"- mean: {info['mean_value']:.2f}\n"
-        response += f"- median: {info['median_value']:.2f}\n"
-        response += f"- min: {info['min_value']:.2f}\n"
-        response += f"- max: {info['max_value']:.2f}\n"
+        lines += [
+            f"- mean: {info['mean_value']:.2f}\n",
+            f"- median: {info['median_value']:.2f}\n",
+            f"- min: {info['min_value']:.2f}\n",
+            f"- max: {info['max_value']:.2f}\n",
+        ]
 
-    return response
+    return "".join(lines)
 
 
 @function_tool
@@ -311,10 +712,12 @@ def find_correlations() -> str:
     if "error" in result:
         return f"error: {result['error']}"
 
-    response = "correlations between numeric columns:\n"
-    for corr in result["correlations"]:
-        response += f"- {corr['column1']} vs {corr['column2']}: {corr['correlation']}\n"
-    return response
+    lines = ["correlations between numeric columns:\n"]
+    lines.extend(
+        f"- {corr['column1']} vs {corr['column2']}: {corr['correlation']}\n"
+        for corr in result["correlations"]
+    )
+    return "".join(lines)
 
 
 @function_tool
@@ -335,13 +738,13 @@ def group_by_column(group_column: str, agg_column: str, agg_function: str = "mea
     if "error" in result:
         return f"error: {result['error']}"
 
-    response = f"grouped by {group_column}, {agg_function} of {agg_column}:\n"
+    lines = [f"grouped by {group_column}, {agg_function} of {agg_column}:\n"]
     for group, value in result["results"].items():
         if isinstance(value, float):
-            response += f"- {group}: {value:.2f}\n"
+            lines.append(f"- {group}: {value:.2f}\n")
         else:
-            response += f"- {group}: {value}\n"
-    return response
+            lines.append(f"- {group}: {value}\n")
+    return "".join(lines)
 
 
 @function_tool
@@ -350,7 +753,6 @@ def suggest_questions() -> str:
     if "error" in result:
         return f"error: {result['error']}"
 
-    response = "here are some questions you might want to ask:\n"
-    for i, suggestion in enumerate(result["suggestions"], 1):
-        response += f"{i}. {suggestion}\n"
-    return response
+    lines = ["here are some questions you might want to ask:\n"]
+    lines.extend(f"{i}. {suggestion}\n" for i, suggestion in enumerate(result["suggestions"], 1))
+    return "".join(lines)